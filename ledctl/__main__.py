@@ -1,37 +1,44 @@
 # ledctl/__main__.py
-import argparse
 import sys
 
+# name -> (entry point, help); every subcommand takes the rest of argv as-is.
+_COMMANDS = {
+    "off": ("ledctl.cli.off:main", "turn LEDs off (one-shot)"),
+    "wiz": ("ledctl.cli.wizard:main", "interactive wizard / helpers"),
+    "setmode": ("ledctl.cli.setmode:main", "set a built-in mode once"),
+    "setpattern": (
+        "ledctl.cli.setpattern:main",
+        "run a custom pattern (stillred, stillblue, breathered, alarm)",
+    ),
+}
 
-def main(argv=None):
-    if argv is None:
-        argv = sys.argv[1:]
+
+def _parse(argv):
+    """Full argparse dispatch: usage, --help and errors for the top level."""
+    import argparse
 
     p = argparse.ArgumentParser(prog="ledctl", description="LED controller")
     sub = p.add_subparsers(dest="cmd", required=True)
+    for name, (entry, help_) in _COMMANDS.items():
+        # NOTE: add_help=False so --help is *not* consumed here.
+        sp = sub.add_parser(name, help=help_, add_help=False)
+        sp.set_defaults(_entry=entry)
+    ns, rest = p.parse_known_args(argv)
+    return ns._entry, rest
 
-    # NOTE: add_help=False so --help is *not* consumed here.
-    sp_off = sub.add_parser("off", help="turn LEDs off (one-shot)", add_help=False)
-    sp_off.set_defaults(_entry="ledctl.cli.off:main")
-
-    sp_wiz = sub.add_parser("wiz", help="interactive wizard / helpers", add_help=False)
-    sp_wiz.set_defaults(_entry="ledctl.cli.wizard:main")
-
-    sp_setmode = sub.add_parser(
-        "setmode", help="set a built-in mode once", add_help=False
-    )
-    sp_setmode.set_defaults(_entry="ledctl.cli.setmode:main")
 
-    sp_setpattern = sub.add_parser(
-        "setpattern",
-        help="run a custom pattern (stillred, stillblue, breathered, alarm)",
-        add_help=False,
-    )
-    sp_setpattern.set_defaults(_entry="ledctl.cli.setpattern:main")
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-    ns, rest = p.parse_known_args(argv)
+    # A known subcommand first is all argparse would work out here; skip
+    # building the parser so one-shot commands never import argparse.
+    if argv and argv[0] in _COMMANDS:
+        entry, rest = _COMMANDS[argv[0]][0], list(argv[1:])
+    else:
+        entry, rest = _parse(argv)
 
-    modpath, funcname = ns._entry.split(":")
+    modpath, funcname = entry.split(":")
     mod = __import__(modpath, fromlist=[funcname])
     func = getattr(mod, funcname)
     # Pass through remaining args (including --help) to the real subcommand.
@@ -0,0 +1,323 @@
+# ledctl/cli/_common.py
+"""Helpers shared by the CLIs: serial arguments and pattern-loop processes."""
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING, Iterator, Tuple
+
+if TYPE_CHECKING:  # argparse is only loaded when a real parser is built
+    import argparse
+
+# Human brightness/speed levels; ints hash to themselves, so help text still
+# lists them in order.
+LEVEL_CHOICES = frozenset((1, 2, 3, 4, 5))
+
+# Same flags as _serial_group(), in ledctl.cli._fastparse spec form.
+SERIAL_FLAGS = {
+    "-p": ("port", "str"),
+    "--port": ("port", "str"),
+    "-B": ("baud", "int"),
+    "--baud": ("baud", "int"),
+    "-t": ("dtr", "store_true"),
+    "--dtr": ("dtr", "store_true"),
+    "-T": ("dtr", "store_false"),
+    "--no-dtr": ("dtr", "store_false"),
+    "-r": ("rts", "store_true"),
+    "--rts": ("rts", "store_true"),
+    "-R": ("rts", "store_false"),
+    "--no-rts": ("rts", "store_false"),
+    "-d": ("delay", "float"),
+    "--delay": ("delay", "float"),
+}
+
+
+def serial_defaults() -> dict:
+    from ledctl.core import BAUD_DEFAULT, IB_DELAY_DEFAULT
+
+    return dict(
+        port=None, baud=BAUD_DEFAULT, dtr=True, rts=False, delay=IB_DELAY_DEFAULT
+    )
+
+
+def _serial_group() -> list:
+    # Defaults come from ledctl.core, which pulls in pyserial; only pay for
+    # that once we actually build a parser.
+    from ledctl.core import BAUD_DEFAULT, IB_DELAY_DEFAULT
+
+    return [
+        ("-p", "--port", dict(help="serial device (auto-detect if omitted)")),
+        (
+            "-B",
+            "--baud",
+            dict(
+                type=int, default=BAUD_DEFAULT, help="baud rate (default: %(default)s)"
+            ),
+        ),
+        (
+            "-t",
+            "--dtr",
+            dict(action="store_true", default=True, help="assert DTR (default)"),
+        ),
+        (
+            "-T",
+            "--no-dtr",
+            dict(dest="dtr", action="store_false", help="deassert DTR"),
+        ),
+        ("-r", "--rts", dict(action="store_true", default=False, help="assert RTS")),
+        (
+            "-R",
+            "--no-rts",
+            dict(dest="rts", action="store_false", help="deassert RTS (default)"),
+        ),
+        (
+            "-d",
+            "--delay",
+            dict(
+                type=float,
+                default=IB_DELAY_DEFAULT,
+                help="inter-byte delay seconds (default: %(default)s)",
+            ),
+        ),
+    ]
+
+
+def bind_serial_args(p: argparse.ArgumentParser) -> None:
+    """Register the -p/-B/-t/-T/-r/-R/-d transport flags on `p`."""
+    for short, longf, kw in _serial_group():
+        p.add_argument(short, longf, **kw)
+
+
+# ---------- pattern-loop processes ----------
+
+@functools.lru_cache(maxsize=1)
+def _pattern_cmdline():
+    """Matcher for the raw /proc cmdline (NUL-separated argv) of "python -m
+    ledctl setpattern <x>" or "/usr/bin/ledctl setpattern <x>", excluding
+    "setpattern kill". Compiled on first use; `off`/`setmode` never scan."""
+    import re
+
+    return re.compile(rb"ledctl[^\0]*\0setpattern\0(?!kill\0)")
+
+
+def _iter_pattern_procs_ps() -> Iterator[Tuple[int, bytes]]:
+    """Fallback for systems without /proc: stream `ps` output line by line.
+
+    Arguments are re-joined with NULs so the /proc matcher applies as is.
+    """
+    import subprocess
+
+    me = os.getpid()
+    match = _pattern_cmdline().search
+    try:
+        proc = subprocess.Popen(
+            ["ps", "-eo", "pid,args"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="ignore",
+        )
+    except Exception:
+        return
+    with proc:
+        for line in proc.stdout:  # type: ignore[union-attr]
+            try:
+                pid_str, args = line.split(None, 1)
+                pid = int(pid_str)
+            except ValueError:
+                continue  # header or blank line
+            if pid == me:
+                continue
+            raw = "\0".join(args.split()).encode() + b"\0"
+            if match(raw):
+                yield pid, raw
+
+
+def iter_pattern_procs() -> Iterator[Tuple[int, bytes]]:
+    """Yield (pid, raw cmdline) of running 'ledctl setpattern' loops (not self)."""
+    try:
+        entries = os.scandir("/proc")
+    except OSError:
+        yield from _iter_pattern_procs_ps()
+        return
+    me = os.getpid()
+    match = _pattern_cmdline().search
+    # Non-root users can only signal their own processes, so don't bother
+    # reading anyone else's cmdline. Root keeps the full scan.
+    my_uid = os.getuid()
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            if pid == me:
+                continue
+            try:
+                if my_uid and entry.stat().st_uid != my_uid:
+                    continue
+                with open(f"/proc/{pid}/cmdline", "rb") as fh:
+                    raw = fh.read(4096)
+            except OSError:
+                continue  # process exited or is not ours to read
+            if match(raw):
+                yield pid, raw
+
+
+def list_pattern_pids() -> list[int]:
+    """Return PIDs for running 'ledctl setpattern' processes (excluding self)."""
+    return [pid for pid, _ in iter_pattern_procs()]
+
+
+def pattern_is_running(pattern: str) -> bool:
+    """True if a 'ledctl setpattern <pattern>' loop is running."""
+    needle = b"\0setpattern\0" + pattern.encode() + b"\0"
+    return any(needle in raw for _, raw in iter_pattern_procs())
+
+
+# Linux signal numbers, spelled out so the kill path needs no `signal` import.
+_SIGTERM = 15
+_SIGKILL = 9
+
+
+def kill_timeout() -> float:
+    """Seconds a loop gets between SIGTERM and SIGKILL; LEDCTL_KILL_TIMEOUT."""
+    try:
+        return max(0.0, float(os.environ.get("LEDCTL_KILL_TIMEOUT", "0.8")))
+    except ValueError:
+        return 0.8
+
+
+def _reaped(pid: int) -> bool:
+    """Reap `pid` if it is an exited child of ours (e.g. a loop the wizard spawned)."""
+    try:
+        return os.waitpid(pid, os.WNOHANG)[0] == pid
+    except ChildProcessError:
+        return False  # not our child, or already reaped
+
+
+def _pid_alive(pid: int) -> bool:
+    # Unreaped children linger as zombies that still answer kill(pid, 0).
+    if _reaped(pid):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _term_by_group(pids: list[int], term_one) -> None:
+    """SIGTERM pattern process groups with one killpg each, the rest via term_one.
+
+    Background loops are spawned with setsid, so they lead their own group
+    (pgid == pid). Groups are only signalled when a pattern is the leader;
+    a foreground loop shares its group with whatever started it.
+    """
+    groups: dict[int, int] = {}
+    for pid in pids:
+        try:
+            groups[pid] = os.getpgid(pid)
+        except OSError:
+            continue  # already gone
+    leaders = {pid for pid, pgid in groups.items() if pid == pgid}
+    for pid, pgid in groups.items():
+        if pgid not in leaders:
+            term_one(pid)
+        elif pid == pgid:
+            try:
+                os.killpg(pgid, _SIGTERM)
+            except OSError:
+                pass
+
+
+def _kill_with_pidfds(pids: list[int], grace: float) -> bool:
+    """SIGTERM pids, wait on their pidfds for up to `grace`, SIGKILL the rest.
+
+    Returns False if pidfds are unavailable (Python < 3.9 or kernel < 5.3) and
+    nothing was signalled, so the caller can fall back to polling.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return False
+    import select
+    import time
+    from signal import pidfd_send_signal
+
+    fds: dict[int, int] = {}
+    try:
+        for pid in pids:
+            try:
+                fds[pidfd_open(pid)] = pid
+            except ProcessLookupError:
+                continue  # already gone
+    except OSError:
+        for fd in fds:
+            os.close(fd)
+        return False
+    by_pid = {pid: fd for fd, pid in fds.items()}
+
+    def term_one(pid: int) -> None:
+        try:
+            pidfd_send_signal(by_pid[pid], _SIGTERM)
+        except Exception:
+            pass
+
+    try:
+        _term_by_group(list(by_pid), term_one)
+        deadline = time.monotonic() + grace
+        pending = set(fds)
+        while pending:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            ready, _, _ = select.select(list(pending), [], [], left)
+            pending.difference_update(ready)
+        for fd in pending:
+            try:
+                pidfd_send_signal(fd, _SIGKILL)
+            except Exception:
+                pass
+    finally:
+        for fd in fds:
+            os.close(fd)
+    for pid in by_pid:
+        _reaped(pid)  # exited children would otherwise stay zombies
+    return True
+
+
+def kill_all_patterns(grace: float | None = None) -> int:
+    """SIGTERM all running pattern loops, SIGKILL what is left after `grace`.
+
+    `grace` defaults to kill_timeout(). Returns how many loops were found.
+    """
+    if grace is None:
+        grace = kill_timeout()
+    pids = list_pattern_pids()
+    if not pids:
+        return 0
+    if _kill_with_pidfds(pids, grace):
+        return len(pids)
+    import time
+
+    def term_one(pid: int) -> None:
+        try:
+            os.kill(pid, _SIGTERM)
+        except Exception:
+            pass
+
+    _term_by_group(pids, term_one)
+    alive = set(pids)
+    deadline = time.monotonic() + grace
+    while True:
+        alive = {pid for pid in alive if _pid_alive(pid)}
+        if not alive or time.monotonic() >= deadline:
+            break
+        time.sleep(0.01)
+    for pid in alive:
+        try:
+            os.kill(pid, _SIGKILL)
+        except Exception:
+            pass
+    return len(pids)
@@ -0,0 +1,78 @@
+# ledctl/cli/_fastparse.py
+"""
+Minimal flag parser for the one-shot CLIs (off, setmode).
+
+It understands exactly the flags described by a spec and nothing else.
+Anything it is unsure about (--help, unknown flags, bad values, missing
+positionals) makes parse() return None, and the caller falls back to its
+full argparse parser, which produces the usual help and error messages.
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+# flag -> (dest, kind); kind is one of the keys of _CONVERT or store_true/false
+FlagSpec = Mapping[str, Tuple[str, str]]
+
+_CONVERT = {"int": int, "float": float, "str": str}
+
+
+def _is_negative_number(tok: str) -> bool:
+    """Whether argparse would read `tok` as a value rather than a flag."""
+    whole, dot, frac = tok[1:].partition(".")
+    if dot:
+        return frac.isdigit() and (not whole or whole.isdigit())
+    return whole.isdigit()
+
+
+def parse(
+    argv: Sequence[str],
+    spec: FlagSpec,
+    defaults: Mapping[str, Any],
+    positionals: Sequence[str] = (),
+    choices: Optional[Mapping[str, Iterable[Any]]] = None,
+) -> Optional[SimpleNamespace]:
+    """Parse argv against spec; return None to request the argparse fallback."""
+    values: Dict[str, Any] = dict(defaults)
+    choices = choices or {}
+    pos = list(positionals)
+    i, n = 0, len(argv)
+    while i < n:
+        tok = argv[i]
+        i += 1
+        if tok.startswith("-") and len(tok) > 1:
+            flag, eq, inline = tok.partition("=")
+            entry = spec.get(flag)
+            if entry is None:
+                return None  # includes -h/--help
+            dest, kind = entry
+            if kind == "store_true" or kind == "store_false":
+                if eq:
+                    return None
+                values[dest] = kind == "store_true"
+                continue
+            if eq:
+                raw = inline
+            elif i < n:
+                raw = argv[i]
+                i += 1
+                if raw.startswith("-") and not _is_negative_number(raw):
+                    return None  # "-p -T": argparse reports the missing value
+            else:
+                return None
+            try:
+                value = _CONVERT[kind](raw)
+            except ValueError:
+                return None
+        elif pos:
+            dest, value = pos.pop(0), tok
+        else:
+            return None
+        # Like argparse, check every occurrence: "-b 7 -b 2" is an error.
+        if dest in choices and value not in choices[dest]:
+            return None
+        values[dest] = value
+    if pos:
+        return None
+    return SimpleNamespace(**values)
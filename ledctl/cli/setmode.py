@@ -8,65 +8,58 @@ Examples:
 """
 from __future__ import annotations
 
-import argparse
+import sys
 from textwrap import dedent
 
-from ledctl.core import set_builtin_mode, BAUD_DEFAULT, IB_DELAY_DEFAULT
+from ledctl.cli import _fastparse
+from ledctl.cli._common import (
+    LEVEL_CHOICES,
+    SERIAL_FLAGS,
+    bind_serial_args,
+    serial_defaults,
+)
+from ledctl.core import set_builtin_mode
 
 _MODE_CHOICES = ("rainbow", "breathing", "cycle")  # 'off' is its own command
 
+_FLAGS = dict(
+    SERIAL_FLAGS,
+    **{
+        "-b": ("brightness", "int"),
+        "--brightness": ("brightness", "int"),
+        "-s": ("speed", "int"),
+        "--speed": ("speed", "int"),
+    },
+)
+
+
+_EPILOG = dedent(
+    """\
+    Notes:
+      • Brightness/speed are human 1..5 (internally mapped to wire 0x05..0x01).
+      • This command is one-shot: sends a single frame and exits.
+      • Continuous/custom animations: `ledctl setpattern ...`.
+
+    Examples:
+      ledctl setmode rainbow
+      ledctl setmode cycle -b 1 -s 3
+      ledctl setmode breathing -p /dev/ttyUSB0 -B 10000 -t -R -d 0.005
+    """
+)
+
 
 def parse_args(argv=None):
-    epilog = dedent(
-        """\
-        Notes:
-          • Brightness/speed are human 1..5 (internally mapped to wire 0x05..0x01).
-          • This command is one-shot: sends a single frame and exits.
-          • Continuous/custom animations: `ledctl setpattern ...`.
-
-        Examples:
-          ledctl setmode rainbow
-          ledctl setmode cycle -b 1 -s 3
-          ledctl setmode breathing -p /dev/ttyUSB0 -B 10000 -t -R -d 0.005
-        """
-    )
+    import argparse
+
     p = argparse.ArgumentParser(
         prog="ledctl setmode",
         description="Set a built-in LED mode once (no loops).",
-        epilog=epilog,
+        epilog=_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     # Serial / transport
-    p.add_argument("-p", "--port", help="serial device (auto-detect if omitted)")
-    p.add_argument(
-        "-B",
-        "--baud",
-        type=int,
-        default=BAUD_DEFAULT,
-        help="baud rate (default: %(default)s)",
-    )
-    p.add_argument(
-        "-t", "--dtr", action="store_true", default=True, help="assert DTR (default)"
-    )
-    p.add_argument(
-        "-T", "--no-dtr", dest="dtr", action="store_false", help="deassert DTR"
-    )
-    p.add_argument("-r", "--rts", action="store_true", default=False, help="assert RTS")
-    p.add_argument(
-        "-R",
-        "--no-rts",
-        dest="rts",
-        action="store_false",
-        help="deassert RTS (default)",
-    )
-    p.add_argument(
-        "-d",
-        "--delay",
-        type=float,
-        default=IB_DELAY_DEFAULT,
-        help="inter-byte delay seconds (default: %(default)s)",
-    )
+    bind_serial_args(p)
 
     # Mode + params
     p.add_argument("name", choices=_MODE_CHOICES, help="built-in mode name")
@@ -74,7 +67,7 @@ def parse_args(argv=None):
         "-b",
         "--brightness",
         type=int,
-        choices=range(1, 6),
+        choices=LEVEL_CHOICES,
         default=1,
         help="brightness 1..5 (default: %(default)s)",
     )
@@ -82,7 +75,7 @@ def parse_args(argv=None):
         "-s",
         "--speed",
         type=int,
-        choices=range(1, 6),
+        choices=LEVEL_CHOICES,
         default=1,
         help="speed 1..5 (default: %(default)s)",
     )
@@ -90,8 +83,20 @@ def parse_args(argv=None):
     return p.parse_args(argv)
 
 
+def _fast_parse(argv):
+    return _fastparse.parse(
+        argv,
+        _FLAGS,
+        dict(serial_defaults(), brightness=1, speed=1),
+        positionals=("name",),
+        choices=dict(name=_MODE_CHOICES, brightness=LEVEL_CHOICES, speed=LEVEL_CHOICES),
+    )
+
+
 def main(argv=None):
-    a = parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+    a = _fast_parse(argv) or parse_args(argv)
     set_builtin_mode(
         mode=a.name,
         brightness=a.brightness,
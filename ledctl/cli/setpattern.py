@@ -24,204 +24,220 @@ Notes:
 from __future__ import annotations
 
 import argparse
-import inspect
+import functools
 import os
-import signal
-import subprocess
 import sys
-from importlib import import_module
 from textwrap import dedent
+from types import MappingProxyType
 
-from ledctl.core import BAUD_DEFAULT, IB_DELAY_DEFAULT
-from ledctl.patterns import list_patterns, run_pattern
+from ledctl.cli._common import (
+    LEVEL_CHOICES,
+    bind_serial_args,
+    kill_all_patterns,
+)
 
 
-# ---------- process management ----------
+# ledctl.patterns is imported only on the paths that need it (not for kill/--help).
 
 
-def _list_pattern_pids() -> list[int]:
-    """Return PIDs for running 'ledctl setpattern' processes (excluding self)."""
-    pids: list[int] = []
-    me = os.getpid()
+def _list_patterns():
+    from ledctl.patterns import list_patterns
+
+    return list_patterns()
+
+
+def _run_pattern(name: str, **kwargs):
+    from ledctl.patterns import run_pattern
+
+    return run_pattern(name, **kwargs)
+
+
+_lock_fd: int | None = None  # held open for the lifetime of the pattern loop
+
+
+def _lock_path() -> str:
+    """Per-user lock file in $XDG_RUNTIME_DIR (or /run/user/<uid>, else /tmp)."""
+    uid = os.getuid()
+    base = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{uid}"
+    if os.path.isdir(base):
+        return os.path.join(base, "ledctl-setpattern.lock")
+    return f"/tmp/ledctl-setpattern-{uid}.lock"
+
+
+def _open_lock_file() -> int | None:
+    """Open the run lock file, or None if it is unusable (a symlink, or not ours)."""
+    import stat
+
     try:
-        out = subprocess.check_output(
-            ["ps", "-eo", "pid,args"], text=True, errors="ignore"
+        fd = os.open(
+            _lock_path(),
+            os.O_RDWR
+            | os.O_CREAT
+            | getattr(os, "O_NOFOLLOW", 0)
+            | getattr(os, "O_CLOEXEC", 0),
+            0o600,
         )
-    except Exception:
-        return pids
-    for line in out.splitlines():
-        line = line.strip()
-        if not line or line.startswith("PID"):
-            continue
-        try:
-            pid_str, args = line.split(None, 1)
-            pid = int(pid_str)
-        except Exception:
-            continue
-        if pid == me:
-            continue
-        # Match both "python -m ledctl setpattern ..." and "ledctl setpattern ..."
-        if (
-            "ledctl" in args
-            and " setpattern " in f" {args} "
-            and " setpattern kill" not in args
-        ):
-            pids.append(pid)
-    return pids
-
-
-def kill_all_patterns(grace: float = 0.8) -> int:
-    """SIGTERM then SIGKILL all running pattern PIDs. Returns count."""
-    pids = _list_pattern_pids()
-    if not pids:
-        return 0
-    for pid in pids:
-        try:
-            os.kill(pid, signal.SIGTERM)
-        except Exception:
-            pass
+    except OSError:
+        return None
     try:
-        import time
-
-        time.sleep(grace)
-    except Exception:
-        pass
-    survivors = _list_pattern_pids()
-    for pid in survivors:
+        st = os.fstat(fd)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode) or st.st_uid != os.geteuid():
+        os.close(fd)  # planted by someone else: leave it alone
+        return None
+    return fd
+
+
+def _hold_run_lock(kill_existing: bool) -> None:
+    """Hold the setpattern run lock (shared) while this loop runs.
+
+    Every pattern loop holds the flock shared, --no-kill-existing ones
+    included, so when a starting loop can take it exclusively none of this
+    user's loops is running and the process scan is skipped. The lock only
+    covers this user's loops; root also stops everyone else's.
+    """
+    global _lock_fd
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    fd = _open_lock_file() if fcntl is not None else None
+    if fd is None:
+        if kill_existing:
+            kill_all_patterns()
+        return
+    if kill_existing:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            idle = True
+        except OSError:
+            idle = False
+        if not idle or os.geteuid() == 0:
+            kill_all_patterns()
+    # Other starters hold it exclusively only for the probe above.
+    import time
+
+    deadline = time.monotonic() + 1.0
+    while True:
         try:
-            os.kill(pid, signal.SIGKILL)
-        except Exception:
-            pass
-    return len(pids)
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                return
+            time.sleep(0.02)
+    _lock_fd = fd
 
 
 # ---------- dynamic arg helpers ----------
 
 _COMMON_CANDIDATES = {
-    "brightness": dict(
-        flags=("-b", "--brightness"),
-        kwargs=dict(type=int, choices=range(1, 6), help="brightness 1..5"),
+    "brightness": (
+        ("-b", "--brightness"),
+        MappingProxyType(dict(type=int, choices=LEVEL_CHOICES, help="brightness 1..5")),
     ),
-    "speed": dict(
-        flags=("-s", "--speed"),
-        kwargs=dict(type=int, choices=range(1, 6), help="speed 1..5"),
+    "speed": (
+        ("-s", "--speed"),
+        MappingProxyType(dict(type=int, choices=LEVEL_CHOICES, help="speed 1..5")),
     ),
-    "period": dict(
-        flags=("--period",), kwargs=dict(type=float, help="seconds per cycle")
+    "period": (
+        ("--period",),
+        MappingProxyType(dict(type=float, help="seconds per cycle")),
     ),
-    "mode_num": dict(
-        flags=("--mode-num",),
-        kwargs=dict(
-            type=lambda x: int(x, 0), help="override raw MODE byte (e.g., 0x03)"
+    "mode_num": (
+        ("--mode-num",),
+        MappingProxyType(
+            dict(type=lambda x: int(x, 0), help="override raw MODE byte (e.g., 0x03)")
         ),
     ),
-    "hz": dict(flags=("--hz",), kwargs=dict(type=float, help="loop frequency (Hz)")),
+    "hz": (("--hz",), MappingProxyType(dict(type=float, help="loop frequency (Hz)"))),
 }
 
-_SERIAL_GROUP = [
-    ("-p", "--port", dict(help="serial device (auto-detect)")),
-    (
-        "-B",
-        "--baud",
-        dict(type=int, default=BAUD_DEFAULT, help="baud (default: %(default)s)"),
-    ),
-    (
-        "-t",
-        "--dtr",
-        dict(action="store_true", default=True, help="assert DTR (default)"),
-    ),
-    ("-T", "--no-dtr", dict(dest="dtr", action="store_false", help="deassert DTR")),
-    ("-r", "--rts", dict(action="store_true", default=False, help="assert RTS")),
-    (
-        "-R",
-        "--no-rts",
-        dict(dest="rts", action="store_false", help="deassert RTS (default)"),
-    ),
-    (
-        "-d",
-        "--delay",
-        dict(
-            type=float,
-            default=IB_DELAY_DEFAULT,
-            help="inter-byte delay seconds (default: %(default)s)",
-        ),
-    ),
-]
 
+@functools.lru_cache(maxsize=64)
+def _pattern_module(name: str):
+    from importlib import import_module
 
-def _bind_serial_args(p: argparse.ArgumentParser) -> None:
-    for short, longf, kw in _SERIAL_GROUP:
-        p.add_argument(short, longf, **kw)
+    return import_module(f".{name}", package="ledctl.patterns")
 
 
-def _pattern_module(name: str):
-    return import_module(f".{name}", package="ledctl.patterns")
+@functools.lru_cache(maxsize=64)
+def _run_signature(name: str):
+    """inspect.signature() of the pattern's run(), computed once per pattern."""
+    import inspect
+
+    return inspect.signature(_pattern_module(name).run)  # type: ignore
 
 
 def _augment_with_pattern_args(p: argparse.ArgumentParser, pattern: str) -> None:
     """Add pattern-specific args from module.add_arguments(parser) or run() signature."""
+    import inspect
+
     mod = _pattern_module(pattern)
     if hasattr(mod, "add_arguments") and callable(getattr(mod, "add_arguments")):
         mod.add_arguments(p)  # type: ignore
         return
     if not hasattr(mod, "run") or not callable(getattr(mod, "run")):
         raise SystemExit(f"Pattern '{pattern}' has no callable run(**kwargs)")
-    sig = inspect.signature(mod.run)  # type: ignore
-    params = sig.parameters
-    for pname, spec in _COMMON_CANDIDATES.items():
-        if pname in params:
-            flags = spec["flags"]
-            kwargs = spec["kwargs"].copy()
-            default = params[pname].default
-            if default is not inspect._empty:
-                kwargs.setdefault("default", default)
-                if "help" in kwargs and default is not None:
-                    kwargs["help"] += f" (default: {default})"
-            p.add_argument(*flags, **kwargs)
+    params = _run_signature(pattern).parameters
+    for pname, param in params.items():
+        spec = _COMMON_CANDIDATES.get(pname)
+        if spec is None:
+            continue
+        flags, base = spec
+        default = param.default
+        if default is inspect.Parameter.empty:
+            p.add_argument(*flags, **base)
+        elif default is None:
+            p.add_argument(*flags, **dict(base, default=default))
+        else:
+            help_text = f"{base['help']} (default: {default})"
+            p.add_argument(*flags, **dict(base, default=default, help=help_text))
+
+
+@functools.lru_cache(maxsize=64)
+def _accepted_params(pattern: str) -> frozenset:
+    """Namespace dests forwarded to this pattern's run() ('delay' for ib_delay)."""
+    params = _run_signature(pattern).parameters
+    names = {"port", "baud", "dtr", "rts", *_COMMON_CANDIDATES}.intersection(params)
+    if "ib_delay" in params:
+        names.add("delay")
+    return frozenset(names)
 
 
 def _filter_kwargs_for_run(pattern: str, ns: argparse.Namespace) -> dict:
     """Build kwargs accepted by the pattern's run() from parsed args."""
-    mod = _pattern_module(pattern)
-    sig = inspect.signature(mod.run)  # type: ignore
-    params = sig.parameters
-
-    kv = {
-        "port": getattr(ns, "port", None),
-        "baud": getattr(ns, "baud", None),
-        "dtr": getattr(ns, "dtr", True),
-        "rts": getattr(ns, "rts", False),
+    accepted = _accepted_params(pattern)
+    return {
+        ("ib_delay" if k == "delay" else k): v
+        for k, v in vars(ns).items()
+        if k in accepted
     }
-    kv = {k: v for k, v in kv.items() if k in params}
-
-    for pname in _COMMON_CANDIDATES.keys():
-        if pname in params and hasattr(ns, pname):
-            kv[pname] = getattr(ns, pname)
 
-    if "ib_delay" in params and hasattr(ns, "delay"):
-        kv["ib_delay"] = ns.delay
 
-    return kv
+# ---------- parser + main ----------
 
 
-# ---------- parser + main ----------
+_EPILOG = dedent(
+    """\
+    Patterns:
+      {names}
 
+    Commands:
+      list            show available patterns and their accepted arguments
+      kill            terminate all running 'ledctl setpattern' loops
+      <pattern> ...   run pattern in foreground by default (Ctrl+C to stop),
+                      or use --background to detach.
 
-def _make_base_parser(names: list[str]) -> argparse.ArgumentParser:
-    epilog = dedent(
-        """\
-        Patterns:
-          {names}
+    By default, starting a pattern will kill any existing ledctl setpattern processes.
+    """
+)
 
-        Commands:
-          list            show available patterns and their accepted arguments
-          kill            terminate all running 'ledctl setpattern' loops
-          <pattern> ...   run pattern in foreground by default (Ctrl+C to stop),
-                          or use --background to detach.
 
-        By default, starting a pattern will kill any existing ledctl setpattern processes.
-        """
-    ).format(names=", ".join(names))
+def _make_base_parser(names: list[str]) -> argparse.ArgumentParser:
+    epilog = _EPILOG.format(names=", ".join(names))
 
     p = argparse.ArgumentParser(
         prog="ledctl setpattern",
@@ -248,8 +264,7 @@ def _print_list(names: list[str]) -> int:
     print("Available patterns:\n")
     for name in names:
         try:
-            mod = _pattern_module(name)
-            run_sig = inspect.signature(mod.run)  # type: ignore
+            run_sig = _run_signature(name)
             params = [
                 p
                 for p in run_sig.parameters
@@ -265,27 +280,84 @@ def _print_list(names: list[str]) -> int:
     return 0
 
 
-def _spawn_background(pattern: str, argv_tail: list[str]) -> int:
+def _spawn_background(
+    pattern: str, argv_tail: list[str], no_kill_existing: bool = False
+) -> int:
     """Re-exec ourselves detached, without the --background flag."""
     log = f"/tmp/ledctl-{pattern}.log"
     cmd = [sys.executable, "-m", "ledctl", "setpattern", pattern] + [
         a for a in argv_tail if a not in ("--background", "-g")
     ]
+    if no_kill_existing:
+        cmd.append("--no-kill-existing")
     with open(log, "ab", buffering=0) as fh:
-        subprocess.Popen(
-            cmd,
-            stdout=fh,
-            stderr=fh,
-            stdin=subprocess.DEVNULL,
-            preexec_fn=os.setsid,
-            close_fds=True,
-        )
+        spawned = False
+        if hasattr(os, "posix_spawn"):
+            # posix_spawn + setsid avoids the fork() path that Popen takes
+            # whenever preexec_fn is set. Our own fds are non-inheritable.
+            try:
+                os.posix_spawn(
+                    sys.executable,
+                    cmd,
+                    os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                        (os.POSIX_SPAWN_DUP2, fh.fileno(), 1),
+                        (os.POSIX_SPAWN_DUP2, fh.fileno(), 2),
+                    ],
+                    setsid=True,
+                )
+                spawned = True
+            except NotImplementedError:
+                pass  # libc without POSIX_SPAWN_SETSID
+        if not spawned:
+            import subprocess
+
+            subprocess.Popen(
+                cmd,
+                stdout=fh,
+                stderr=fh,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+                # Our fds (lock, log, serial) are all O_CLOEXEC: skip the close loop.
+                close_fds=False,
+                pass_fds=(),
+            )
     print(f"[ledctl] started pattern '{pattern}' in background (log: {log})")
     return 0
 
 
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the first positional token, or None if there is none (or --help)."""
+    for tok in argv:
+        if tok in ("-h", "--help"):
+            return None
+        if not tok.startswith("-"):
+            return tok
+    return None
+
+
+def _kill_cmd() -> int:
+    n = kill_all_patterns()
+    print(f"[ledctl] killed {n} pattern process(es)")
+    return 0
+
+
 def main(argv=None):
-    names = list_patterns()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast dispatch: admin commands and unknown names never build a parser.
+    head = _peek_command(argv)
+    if head == "kill":
+        return _kill_cmd()
+
+    names = _list_patterns()
+    if head == "list":
+        return _print_list(names)
+    if head is not None and head not in names:
+        raise SystemExit(f"Unknown pattern '{head}'. Try: ledctl setpattern list")
+
     base = _make_base_parser(names)
 
     # First-stage parse (pattern-or-cmd + global flags)
@@ -295,9 +367,7 @@ def main(argv=None):
     if not a.pattern_or_cmd or a.pattern_or_cmd == "list":
         return _print_list(names)
     if a.pattern_or_cmd == "kill":
-        n = kill_all_patterns()
-        print(f"[ledctl] killed {n} pattern process(es)")
-        return 0
+        return _kill_cmd()
 
     # Pattern run
     pattern = a.pattern_or_cmd
@@ -319,21 +389,25 @@ def main(argv=None):
         action="store_true",
         help="do not terminate existing pattern loops before starting",
     )
-    _bind_serial_args(runner)
+    bind_serial_args(runner)
     _augment_with_pattern_args(runner, pattern)
 
     # IMPORTANT: parse only the tail (everything after the pattern),
     # not the full argv — otherwise 'stillred' appears as an extra arg.
     ns = runner.parse_args(tail)
+    # The first stage consumes these flags, so the runner's copies stay False
+    # unless they reach it some other way (e.g. after "--").
+    background = a.background or ns.background
+    no_kill_existing = a.no_kill_existing or ns.no_kill_existing
 
-    if not ns.no_kill_existing:
-        kill_all_patterns()
+    if background:
+        # The detached child takes the run lock and replaces old loops itself.
+        return _spawn_background(pattern, tail, no_kill_existing)
 
-    if ns.background:
-        return _spawn_background(pattern, tail)
+    _hold_run_lock(kill_existing=not no_kill_existing)
 
     kwargs = _filter_kwargs_for_run(pattern, ns)
     try:
-        return run_pattern(pattern, **kwargs)
+        return _run_pattern(pattern, **kwargs)
     except KeyboardInterrupt:
         return 0
@@ -5,6 +5,7 @@ LED wizard (curses, centered, sticky):
   ←/→   change value
   Enter apply current selection (built-ins = one-shot, patterns = background)
   o     Off (one-shot)  — also kills any running pattern
+  r     Rescan serial ports (hotplug)
   q     Quit            — re-issues current selection so it "sticks"
 
 Notes:
@@ -16,12 +17,15 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import curses
+import functools
 import os
-import signal
-import subprocess
 import sys
-from typing import List, Tuple
+import textwrap
+import time
+from typing import Tuple
 
+from ledctl.cli._common import kill_all_patterns, pattern_is_running
 from ledctl.core import (
     BAUD_DEFAULT,
     IB_DELAY_DEFAULT,
@@ -34,6 +38,9 @@ from ledctl.patterns import list_patterns
 # Built-ins from core
 BUILTINS = set(BUILTIN_MODES.keys())
 
+# Selectable names: "off" first, then built-ins and patterns alphabetically
+_ALL_NAMES = ("off",) + tuple(sorted((BUILTINS | set(list_patterns())) - {"off"}))
+
 # Pattern arg rules
 PATTERN_ONLY_B = {"stillred", "stillblue"}  # brightness only
 PATTERN_ONLY_NONE = {"alarm"}  # no args
@@ -97,98 +104,36 @@ GENERAL_INFO = (
 # -------------------- enablement helpers --------------------
 
 
+# name -> (brightness enabled, speed enabled). Later entries win, so the
+# precedence matches the old if-chains: built-ins, then ONLY_B, SPEED_PRESETS.
+_CAPS = {
+    **dict.fromkeys(PATTERN_ONLY_NONE, (False, False)),
+    **dict.fromkeys(PATTERN_SPEED_PRESETS, (False, True)),
+    **dict.fromkeys(PATTERN_ONLY_B, (True, False)),
+    **dict.fromkeys(BUILTINS, (True, True)),
+}
+
+
 def brightness_enabled(name: str) -> bool:
-    if name in BUILTINS:
-        return True
-    if name in PATTERN_ONLY_B:
-        return True
-    if name in PATTERN_SPEED_PRESETS:
-        return False
-    if name in PATTERN_ONLY_NONE:
-        return False
-    return True
+    return _CAPS.get(name, (True, True))[0]
 
 
 def speed_enabled(name: str) -> bool:
-    if name in BUILTINS:
-        return True
-    if name in PATTERN_ONLY_B:
-        return False
-    if name in PATTERN_SPEED_PRESETS:
-        return True
-    if name in PATTERN_ONLY_NONE:
-        return False
-    return True
+    return _CAPS.get(name, (True, True))[1]
 
 
 # -------------------- pattern process helpers --------------------
 
 
-def _pattern_pids() -> List[int]:
-    """Find running 'ledctl setpattern' processes (excluding self)."""
-    me = os.getpid()
-    pids: List[int] = []
-    try:
-        out = subprocess.check_output(["pgrep", "-f", r"ledctl.*setpattern"], text=True)
-        for s in out.splitlines():
-            if s.strip().isdigit():
-                pid = int(s.strip())
-                if pid != me:
-                    pids.append(pid)
-        return pids
-    except Exception:
-        pass
-    try:
-        out = subprocess.check_output(["ps", "-eo", "pid,cmd"], text=True)
-        for line in out.splitlines():
-            parts = line.strip().split(None, 1)
-            if len(parts) != 2:
-                continue
-            pid_s, cmd = parts
-            if not pid_s.isdigit():
-                continue
-            pid = int(pid_s)
-            if pid == me:
-                continue
-            if "ledctl" in cmd and " setpattern " in cmd and "grep" not in cmd:
-                pids.append(pid)
-    except Exception:
-        pass
-    return pids
-
-
-def _pattern_is_running(pattern: str) -> bool:
-    try:
-        out = subprocess.check_output(["ps", "-eo", "pid,cmd"], text=True)
-        needle = f" setpattern {pattern} "
-        return any(needle in f" {line} " for line in out.splitlines())
-    except Exception:
-        return False
-
-
-def _kill_running_patterns() -> int:
-    """SIGTERM then SIGKILL any setpattern processes. Return count found."""
-    pids = _pattern_pids()
-    if not pids:
-        return 0
-    for pid in pids:
-        try:
-            os.kill(pid, signal.SIGTERM)
-        except Exception:
-            pass
-    try:
-        import time
-
-        time.sleep(0.5)
-    except Exception:
-        pass
-    survivors = set(_pattern_pids())
-    for pid in survivors:
-        try:
-            os.kill(pid, signal.SIGKILL)
-        except Exception:
-            pass
-    return len(pids)
+_CHILD_ENV: dict | None = None
+
+
+def _get_child_env() -> dict:
+    """Environment for spawned loops, built once (the wizard never edits os.environ)."""
+    global _CHILD_ENV
+    if _CHILD_ENV is None:
+        _CHILD_ENV = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    return _CHILD_ENV
 
 
 def _spawn_pattern_background(
@@ -213,6 +158,8 @@ def _spawn_pattern_background(
     if (pattern in PATTERN_SPEED_PRESETS) and (speed is not None):
         cmd += ["-s", str(max(1, min(4, int(speed))))]
 
+    import subprocess  # only needed once a pattern is applied
+
     with open(os.devnull, "wb") as devnull:
         try:
             proc = subprocess.Popen(
@@ -220,22 +167,34 @@ def _spawn_pattern_background(
                 stdout=devnull,
                 stderr=devnull,
                 stdin=devnull,
-                preexec_fn=os.setsid,  # detach (nohup-like)
-                close_fds=True,
-                env=dict(os.environ, PYTHONUNBUFFERED="1"),
+                start_new_session=True,  # setsid in the child (nohup-like)
+                # Python opens every fd O_CLOEXEC (PEP 446), pyserial's port
+                # included, so exec drops them without a userspace close loop.
+                close_fds=False,
+                pass_fds=(),
+                env=_get_child_env(),
             )
             return proc.pid
         except Exception:
             return None
 
 
-# -------------------- centered curses UI --------------------
+def _replace_pattern(**spawn_kwargs) -> int | None:
+    """Stop running loops and start a new one, with a single /proc scan.
 
+    The detached child finds the setpattern run lock free and so (unless run
+    as root) skips its own process scan as well.
+    """
+    kill_all_patterns()
+    return _spawn_pattern_background(**spawn_kwargs)
 
-def _wrap(text: str, width: int) -> list[str]:
-    """Simple word-wrap to a list of lines that fit `width`."""
-    import textwrap
 
+# -------------------- centered curses UI --------------------
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_cached(text: str, width: int) -> Tuple[str, ...]:
+    """Simple word-wrap to lines that fit `width` (info texts are constants)."""
     wrapped: list[str] = []
     for para in text.splitlines():
         if not para.strip():
@@ -246,28 +205,40 @@ def _wrap(text: str, width: int) -> list[str]:
                 para, width=width, break_long_words=False, replace_whitespace=False
             )
         )
-    return wrapped
+    return tuple(wrapped)
+
+
+def _wrap(text: str, width: int) -> list[str]:
+    return list(_wrap_cached(text, width))
+
+
+# Panel windows keyed by (h, w, y0, x0), reused while the geometry is stable.
+_WINDOWS: dict = {}
 
 
 def _center_box(
     stdscr, lines: list[str], title: str = "", highlight_rows: set[int] | None = None
 ):
     """Create a centered window sized to `lines` and render them (bold highlights)."""
-    import curses
-
     H, W = stdscr.getmaxyx()
 
-    # Before drawing a differently-sized window, clear the background so old boxes don't linger.
-    stdscr.erase()
-    stdscr.refresh()
-
     inner_width = max(60, *(len(ln) for ln in lines)) if lines else 60
     inner_height = len(lines) + 4  # border + padding
     w = min(W - 2, inner_width + 4)
     h = min(H - 2, inner_height)
     y0 = max(0, (H - h) // 2)
     x0 = max(0, (W - w) // 2)
-    win = curses.newwin(h, w, y0, x0)
+    geom = (h, w, y0, x0)
+    win = _WINDOWS.get(geom)
+    if win is None:
+        # Different size/position: drop old panels and clear the background
+        # once so old boxes don't linger.
+        _WINDOWS.clear()
+        stdscr.clear()
+        stdscr.noutrefresh()
+        win = _WINDOWS[geom] = curses.newwin(h, w, y0, x0)
+    else:
+        win.erase()
     win.box()
     if title:
         try:
@@ -288,34 +259,58 @@ def _center_box(
         y += 1
         if y >= h - 1:
             break
-    win.refresh()
+    # One physical screen update, even when the background was cleared above.
+    win.noutrefresh()
+    curses.doupdate()
+    return win
 
 
-def _compose_lines(
-    port: str, cur: str, b: int, s: int, dtr: bool, rts: bool, max_width: int
+# Window row of the first field: border, padding, header, blank line.
+FIELD_ROW0 = 4
+
+
+# Field row formats, in cursor order: Port, Name, Brightness, Speed, DTR, RTS.
+_FIELD_FMTS = (
+    "Port:       {}",
+    "Name:       {}",
+    "Brightness: {}  (1..5){}",
+    "Speed:      {}  (1..5){}",
+    "DTR:        {}",
+    "RTS:        {}",
+)
+
+
+def _field_lines(
+    port: str, cur: str, b: int, s: int, dtr: bool, rts: bool
 ) -> list[str]:
-    """Build wrapped lines for the centered panel."""
-    header = "↑/↓ Field   ←/→ Change   Enter=Apply   o=Off   q=Quit (sticks)"
-    fields = [
-        f"Port:       {port}",
-        f"Name:       {cur}",
-        f"Brightness: {b}  (1..5){'' if brightness_enabled(cur) else '  [disabled]'}",
-        f"Speed:      {s}  (1..5){'' if speed_enabled(cur) else '  [disabled]'}",
-        f"DTR:        {'ON' if dtr else 'OFF'}",
-        f"RTS:        {'ON' if rts else 'OFF'}",
+    """The six editable rows (Port, Name, Brightness, Speed, DTR, RTS)."""
+    f_port, f_name, f_bright, f_speed, f_dtr, f_rts = _FIELD_FMTS
+    return [
+        f_port.format(port),
+        f_name.format(cur),
+        f_bright.format(b, "" if brightness_enabled(cur) else "  [disabled]"),
+        f_speed.format(s, "" if speed_enabled(cur) else "  [disabled]"),
+        f_dtr.format("ON" if dtr else "OFF"),
+        f_rts.format("ON" if rts else "OFF"),
     ]
 
-    info_block = []
-    if cur in BUILTINS:
-        info_block += _wrap(MODE_INFO.get(cur, ""), max_width)
-    else:
-        info_block += _wrap(PATTERN_INFO.get(cur, ""), max_width)
 
-    info_block += [""]
-    info_block += _wrap(GENERAL_INFO, max_width)
+_HEADER = "↑/↓ Field   ←/→ Change   Enter=Apply   o=Off   r=Rescan   q=Quit (sticks)"
+
 
-    lines = [header, ""] + fields + [""] + info_block
-    return lines
+@functools.lru_cache(maxsize=64)
+def _static_block(cur: str, max_width: int) -> Tuple[str, ...]:
+    """Wrapped info rows below the fields; they only depend on name and width."""
+    info = MODE_INFO.get(cur, "") if cur in BUILTINS else PATTERN_INFO.get(cur, "")
+    return (*_wrap(info, max_width), "", *_wrap(GENERAL_INFO, max_width))
+
+
+def _compose_lines(
+    port: str, cur: str, b: int, s: int, dtr: bool, rts: bool, max_width: int
+) -> list[str]:
+    """Build wrapped lines for the centered panel."""
+    fields = _field_lines(port, cur, b, s, dtr, rts)
+    return [_HEADER, "", *fields, "", *_static_block(cur, max_width)]
 
 
 def _curses_ui(
@@ -324,8 +319,6 @@ def _curses_ui(
     """Run the TUI and return the final selection + whether a pattern is running.
     Returns: (name, bright, speed, dtr, rts, port, pattern_running_now)
     """
-    import curses
-
     ports = find_ports()
     if not ports:
         print("No CH340 tty found.")
@@ -334,11 +327,9 @@ def _curses_ui(
     port_idx = 0
     if port_hint and port_hint in ports:
         port_idx = ports.index(port_hint)
+    ports_ts = time.monotonic()
 
-    names = sorted(BUILTINS | set(list_patterns()))
-    if "off" in names:
-        names.remove("off")
-        names.insert(0, "off")
+    names = _ALL_NAMES
 
     name_idx = 0
     bright = 3
@@ -347,7 +338,12 @@ def _curses_ui(
     idx = 1  # field cursor: 0..5  (Port, Name, Brightness, Speed, DTR, RTS)
     pattern_running = False
 
+    win = None  # panel window from the last full draw
+    shown: list = [None] * 6  # (text, attr) currently on screen per field row
+
     def draw(stdscr):
+        """Full redraw: re-wrap the info text and rebuild the centered panel."""
+        nonlocal win
         H, W = stdscr.getmaxyx()
         # Compose lines with wrapping margin that fits the centered window nicely
         wrap_w = max(60, min(W - 10, 100))
@@ -365,14 +361,47 @@ def _curses_ui(
             5: field_base + 5,  # RTS
         }
         hi = {highlight_map[idx]}
-        _center_box(stdscr, lines, title="LEDCTL Wizard", highlight_rows=hi)
+        win = _center_box(stdscr, lines, title="LEDCTL Wizard", highlight_rows=hi)
+        shown[:] = [None] * 6  # rows were drawn unpadded; rewrite on next change
+
+    def draw_fields():
+        """Rewrite, in place, only the field rows whose text or highlight changed."""
+        h, w = win.getmaxyx()
+        fields = _field_lines(
+            ports[port_idx], names[name_idx], bright, speed, _dtr, _rts
+        )
+        for i, txt in enumerate(fields):
+            y = FIELD_ROW0 + i
+            if y >= h - 1:
+                break
+            row = (txt, curses.A_BOLD if i == idx else 0)
+            if shown[i] == row:
+                continue
+            shown[i] = row
+            try:
+                win.addstr(y, 2, txt[: max(0, w - 4)].ljust(w - 4), row[1])
+            except curses.error:
+                pass
+        win.noutrefresh()
+        curses.doupdate()
+
+    def refresh_ports(force: bool = False):
+        """Re-glob ports at most once per second (or now, if forced)."""
+        nonlocal port_idx, ports_ts
+        now = time.monotonic()
+        if not force and now - ports_ts < 1.0:
+            return
+        ports_ts = now
+        current = ports[port_idx]
+        ports[:] = find_ports() or ports
+        port_idx = ports.index(current) if current in ports else 0
 
     def apply_current():
         nonlocal pattern_running
-        _kill_running_patterns()
         cur = names[name_idx]
         port = ports[port_idx]
         if cur in BUILTINS:
+            kill_all_patterns()
             send_frame_one_shot(
                 port=port,
                 mode=BUILTIN_MODES[cur],
@@ -385,7 +414,7 @@ def _curses_ui(
             )
             pattern_running = False
         else:
-            _spawn_pattern_background(
+            _replace_pattern(
                 pattern=cur,
                 port=port,
                 baud=BAUD_DEFAULT,
@@ -399,64 +428,100 @@ def _curses_ui(
     def main(stdscr):
         nonlocal idx, port_idx, name_idx, bright, speed, _dtr, _rts, pattern_running
         curses.curs_set(0)
+        _WINDOWS.clear()  # windows from an earlier curses session are dead
         draw(stdscr)
         while True:
+            stdscr.timeout(-1)
             key = stdscr.getch()
-            if key in (ord("q"), ord("Q")):
-                cur = names[name_idx]
-                return (
-                    cur,
-                    bright,
-                    speed,
-                    _dtr,
-                    _rts,
-                    ports[port_idx],
-                    pattern_running,
-                )
-            if key in (ord("o"), ord("O")):
-                _kill_running_patterns()
-                send_frame_one_shot(
-                    port=ports[port_idx],
-                    mode=BUILTIN_MODES.get("off", list(BUILTIN_MODES.values())[0]),
-                    brightness=bright,
-                    speed=speed,
-                    baud=BAUD_DEFAULT,
-                    dtr=_dtr,
-                    rts=_rts,
-                    ib_delay=delay,
-                )
-                pattern_running = False
-                draw(stdscr)
-                continue
-
-            if key == curses.KEY_UP:
-                idx = (idx - 1) % 6
-            elif key == curses.KEY_DOWN:
-                idx = (idx + 1) % 6
-            elif key in (curses.KEY_LEFT, curses.KEY_RIGHT):
-                step = -1 if key == curses.KEY_LEFT else 1
-                cur = names[name_idx]
-                if idx == 0:
-                    ports[:] = find_ports() or ports
-                    if ports:
-                        port_idx = (port_idx + step) % len(ports)
-                elif idx == 1:
-                    name_idx = (name_idx + step) % len(names)
-                    _kill_running_patterns()
+            # Apply every key already queued (held arrows auto-repeat faster
+            # than a slow TTY redraws), then paint the result once.  Only a new
+            # name (info text), port (panel width) or terminal size needs the
+            # full panel rebuilt; other changes touch field rows, and keys that
+            # change nothing on screen (unmapped, Enter, o, clamped values)
+            # draw nothing at all.  The burst is capped at one frame (16 ms)
+            # from its first key: past that, draw and leave the rest queued
+            # for the next pass.
+            full = dirty = False
+            stale = False  # name changed: the running loop no longer matches
+            deadline = time.monotonic() + 0.016
+            while key != -1:
+                if key in (ord("q"), ord("Q")):
+                    if stale:
+                        kill_all_patterns()
+                    cur = names[name_idx]
+                    return (
+                        cur,
+                        bright,
+                        speed,
+                        _dtr,
+                        _rts,
+                        ports[port_idx],
+                        pattern_running,
+                    )
+                if key in (ord("o"), ord("O")):
+                    kill_all_patterns()
+                    stale = False
+                    send_frame_one_shot(
+                        port=ports[port_idx],
+                        mode=BUILTIN_MODES.get("off", list(BUILTIN_MODES.values())[0]),
+                        brightness=bright,
+                        speed=speed,
+                        baud=BAUD_DEFAULT,
+                        dtr=_dtr,
+                        rts=_rts,
+                        ib_delay=delay,
+                    )
                     pattern_running = False
-                elif idx == 2 and brightness_enabled(cur):
-                    bright = min(5, max(1, bright + step))
-                elif idx == 3 and speed_enabled(cur):
-                    speed = min(5, max(1, speed + step))
-                elif idx == 4:
-                    _dtr = not _dtr
-                elif idx == 5:
-                    _rts = not _rts
-            elif key in (curses.KEY_ENTER, 10, 13):
-                apply_current()
-            draw(stdscr)
-
-    import curses
+                elif key == curses.KEY_RESIZE:
+                    _wrap_cached.cache_clear()
+                    _static_block.cache_clear()
+                    full = True
+                elif key in (ord("r"), ord("R")):
+                    refresh_ports(force=True)
+                    full = True
+                elif key == curses.KEY_UP:
+                    idx = (idx - 1) % 6
+                    dirty = True
+                elif key == curses.KEY_DOWN:
+                    idx = (idx + 1) % 6
+                    dirty = True
+                elif key in (curses.KEY_LEFT, curses.KEY_RIGHT):
+                    step = -1 if key == curses.KEY_LEFT else 1
+                    cur = names[name_idx]
+                    if idx == 0:
+                        refresh_ports()
+                        port_idx = (port_idx + step) % len(ports)
+                        full = True
+                    elif idx == 1:
+                        name_idx = (name_idx + step) % len(names)
+                        pattern_running = False
+                        stale = full = True
+                    elif idx == 2 and brightness_enabled(cur):
+                        bright, old = min(5, max(1, bright + step)), bright
+                        dirty = dirty or bright != old
+                    elif idx == 3 and speed_enabled(cur):
+                        speed, old = min(5, max(1, speed + step)), speed
+                        dirty = dirty or speed != old
+                    elif idx == 4:
+                        _dtr = not _dtr
+                        dirty = True
+                    elif idx == 5:
+                        _rts = not _rts
+                        dirty = True
+                elif key in (curses.KEY_ENTER, 10, 13):
+                    apply_current()  # stops any running loop itself
+                    stale = False
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                stdscr.timeout(max(1, int(left * 1000)))
+                key = stdscr.getch()
+            if stale:
+                kill_all_patterns()
+            if full:
+                draw(stdscr)
+            elif dirty:
+                draw_fields()
 
     return curses.wrapper(main)
 
@@ -496,24 +561,22 @@ def _reissue_after_quit(
 ):
     """After curses exits, re-issue selection so it persists."""
     if name in BUILTINS:
-        cmd = [
-            sys.executable,
-            "-m",
-            "ledctl",
-            "setmode",
-            name,
-            "-b",
-            str(b),
-            "-s",
-            str(s),
-        ]
-        if port:
-            cmd += ["--port", port]
-        cmd += ["--dtr" if dtr else "--no-dtr", "--rts" if rts else "--no-rts"]
-        cmd += ["--baud", str(BAUD_DEFAULT)]
-        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # Same one frame `ledctl setmode` would send, without a new interpreter.
+        try:
+            send_frame_one_shot(
+                port=port or None,
+                mode=BUILTIN_MODES[name],
+                brightness=b,
+                speed=s,
+                baud=BAUD_DEFAULT,
+                dtr=dtr,
+                rts=rts,
+                ib_delay=IB_DELAY_DEFAULT,
+            )
+        except Exception:
+            pass  # stay quiet on exit, as the old setmode subprocess did
     else:
-        if not _pattern_is_running(name):
+        if not pattern_is_running(name):
             _spawn_pattern_background(
                 pattern=name,
                 port=port if port else None,
@@ -10,7 +10,9 @@ from .core import (
     find_ports,
     checksum,
     build_frame,
+    build_frames,
     send_frame_one_shot,
+    drive,
 )
 
 __all__ = [
@@ -24,7 +26,9 @@ __all__ = [
     "find_ports",
     "checksum",
     "build_frame",
+    "build_frames",
     "send_frame_one_shot",
+    "drive",
     "set_builtin_mode",
     "resolve_mode",
 ]
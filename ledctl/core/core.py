@@ -1,16 +1,21 @@
 # ledctl/core/core.py
 from __future__ import annotations
 
+import atexit
 import glob
+import os
+import struct
 import time
 from types import SimpleNamespace
-from typing import Optional, Tuple
+from typing import Iterable, Optional
 
 try:
     import serial  # pyserial
 except ImportError as e:
     raise SystemExit("Missing dependency pyserial. Try: pip install pyserial") from e
 
+from .timing import sleep_until
+
 BAUD_DEFAULT = 10000
 IB_DELAY_DEFAULT = 0.005  # inter-byte delay, seconds
 
@@ -37,7 +42,13 @@ LEVEL_TO_WIRE = {1: 0x05, 2: 0x04, 3: 0x03, 4: 0x02, 5: 0x01}
 
 
 def find_ports():
-    """Return a prioritized list of candidate CH340 ports."""
+    """Return a prioritized list of candidate CH340 ports.
+
+    LEDCTL_PORT, when set, is the only candidate and no globbing is done.
+    """
+    env_port = os.environ.get("LEDCTL_PORT")
+    if env_port:
+        return [env_port]
     return (
         sorted(glob.glob("/dev/serial/by-path/*-if00-port0"))
         or sorted(glob.glob("/dev/ttyUSB*"))
@@ -55,14 +66,63 @@ def checksum(mode: int, bw: int, sw: int) -> int:
     return (0xFA + mode + bw + sw) & 0xFF
 
 
-def build_frame(
-    mode: int, bright_h: int, speed_h: int
-) -> Tuple[int, int, int, int, int]:
+# Wire frame: 0xFA, mode, brightness, speed, checksum (one unsigned byte each).
+_FRAME_STRUCT = struct.Struct("5B")
+
+
+def _encode_frame(mode: int, bright_h: int, speed_h: int) -> bytes:
     if bright_h not in LEVEL_TO_WIRE or speed_h not in LEVEL_TO_WIRE:
         raise ValueError("brightness/speed must be in 1..5")
+    if not 0 <= mode <= 0xFF:
+        raise ValueError("mode must be in 0..255")
     bw = LEVEL_TO_WIRE[bright_h]
     sw = LEVEL_TO_WIRE[speed_h]
-    return (0xFA, mode, bw, sw, checksum(mode, bw, sw))
+    return _FRAME_STRUCT.pack(0xFA, mode, bw, sw, checksum(mode, bw, sw))
+
+
+# Cap on bytes LedCtl queues while the port's TX buffer is full (~4 s at 10000 baud).
+_PENDING_MAX = 4096
+
+# Every frame for the known modes: 5 modes x 5 brightness x 5 speed = 125.
+_FRAME_CACHE = {
+    (m, b, s): _encode_frame(m, b, s)
+    for m in vars(MODE).values()
+    for b in LEVEL_TO_WIRE
+    for s in LEVEL_TO_WIRE
+}
+
+
+def build_frame(mode: int, bright_h: int, speed_h: int) -> bytes:
+    frame = _FRAME_CACHE.get((mode, bright_h, speed_h))
+    if frame is None:  # out-of-range level (raises) or a raw mode byte
+        frame = _encode_frame(mode, bright_h, speed_h)
+    return frame
+
+
+def build_frames(
+    modes: Iterable[int], brights: Iterable[int], speeds: Iterable[int]
+) -> bytes:
+    """Concatenate frames for parallel sequences, ready for a single write()."""
+    return b"".join(map(build_frame, modes, brights, speeds))
+
+
+def _write_paced(write, frame: bytes, ib_delay: float, baud: int) -> None:
+    """Write one frame: a single write() when unpaced, else byte by byte.
+
+    With ib_delay > 0 the bytes keep their inter-byte gap (some controllers
+    drop frames that arrive back to back); ib_delay=0 sends the whole frame
+    with one write(). Nothing is flushed here: the sleep also covers each
+    byte's wire time (10 bits at 8N1), which keeps the spacing of the old
+    per-byte tcdrain() without the syscall. Callers flush before closing.
+    """
+    if ib_delay <= 0:
+        write(frame)
+        return
+    gap = ib_delay + 10.0 / baud
+    view = memoryview(frame)
+    for i in range(len(frame)):
+        write(view[i : i + 1])
+        time.sleep(gap)
 
 
 def send_frame_one_shot(
@@ -76,21 +136,53 @@ def send_frame_one_shot(
     rts: bool = False,
     ib_delay: float = IB_DELAY_DEFAULT,
 ) -> None:
-    """Open the port, send one frame, close."""
+    """Send one frame; the port stays open for later calls in this process.
+
+    Scripts that call this in a loop reuse one LedCtl instead of paying for
+    serial.Serial() setup each time; it is reopened when dev, baud or the
+    DTR/RTS levels change, and closed at interpreter exit.
+    """
     dev = port or find_port()
     if not dev:
         raise SystemExit("No CH340 tty found (try plugging/replugging).")
-    frame = build_frame(mode, brightness, speed)
-    srl = serial.Serial(dev, baud, bytesize=8, parity="N", stopbits=1, timeout=1)
-    srl.dtr = dtr
-    srl.rts = rts
+    build_frame(mode, brightness, speed)  # validate before touching the port
+    ctl = _shared_ctl(dev, baud, dtr, rts)
+    ctl.ib_delay = ib_delay
     try:
-        for b in frame:
-            srl.write(bytes([b]))
-            srl.flush()
-            time.sleep(ib_delay)
-    finally:
-        srl.close()
+        ctl.set_mode_once(mode, brightness, speed)
+        ctl.ser.flush()
+    except BaseException:
+        _close_shared()  # e.g. unplugged: start from a fresh open next time
+        raise
+
+
+_SHARED: Optional["LedCtl"] = None
+
+
+def _shared_ctl(dev: str, baud: int, dtr: bool, rts: bool) -> "LedCtl":
+    global _SHARED
+    ctl = _SHARED
+    if ctl is not None:
+        if (ctl.port, ctl.baud, ctl.dtr, ctl.rts) == (dev, baud, dtr, rts):
+            return ctl
+        _close_shared()
+    ctl = LedCtl(dev, baud=baud, dtr=dtr, rts=rts)
+    ctl.open()
+    _SHARED = ctl
+    return ctl
+
+
+def _close_shared() -> None:
+    global _SHARED
+    ctl, _SHARED = _SHARED, None
+    if ctl is not None:
+        try:
+            ctl.close()
+        except Exception:
+            pass  # best effort: the port may already be gone
+
+
+atexit.register(_close_shared)  # flush and release the shared port on exit
 
 
 class LedCtl:
@@ -113,21 +205,62 @@ class LedCtl:
         self.dtr = dtr
         self.rts = rts
         self.ser = None
+        self._fd = None  # raw fd of the open port, if pyserial exposes one
+        self._pending = bytearray()  # bytes the non-blocking fd didn't take yet
+        self._sel = None  # selector for write readiness on _fd, made on first drain
+        self._pollable = True  # cleared if _fd cannot be registered
+        self._last_key = None  # (mode, brightness, speed) of the last frame sent
+        self._last_frame = b""
 
     def open(self):
         if self.ser is None:
-            self.ser = serial.Serial(
-                self.port, self.baud, bytesize=8, parity="N", stopbits=1, timeout=1
+            # pyserial already applies raw termios settings with TCSANOW (no
+            # ICANON/ECHO/ISIG, no OPOST/ONLCR), so writes go straight to the
+            # driver's TX buffer; a second cfmakeraw() would only add syscalls.
+            # Set DTR/RTS before open() so pyserial applies them as it opens,
+            # instead of raising both lines (its default) and then correcting.
+            # No exclusive=True: the wizard keeps its port open while the
+            # pattern loops it spawns open the same device.
+            ser = serial.Serial(
+                None,
+                self.baud,
+                bytesize=8,
+                parity="N",
+                stopbits=1,
+                timeout=1,
+                xonxoff=False,
+                rtscts=False,
+                dsrdtr=False,
             )
-            self.ser.dtr = self.dtr
-            self.ser.rts = self.rts
+            ser.port = self.port
+            ser.dtr = self.dtr
+            ser.rts = self.rts
+            ser.open()
+            self.ser = ser
+            try:
+                self._fd = self.ser.fileno()
+                os.set_blocking(self._fd, False)  # pyserial's default, made explicit
+            except (AttributeError, OSError, ValueError):
+                self._fd = None  # e.g. Windows: no fd, use pyserial's write()
 
     def close(self):
         if self.ser is not None:
             try:
-                self.ser.close()
+                if self._pending:
+                    self.ser.write(bytes(self._pending))  # waits for room
+                    self._pending.clear()
+                self.ser.flush()  # let the last frame drain before closing
             finally:
-                self.ser = None
+                try:
+                    self.ser.close()
+                finally:
+                    self.ser = None
+                    self._fd = None
+                    if self._sel is not None:
+                        self._sel.close()
+                        self._sel = None
+                    self._pollable = True
+                    self._last_key = None  # a reopened port starts unknown
 
     def __enter__(self):
         self.open()
@@ -136,14 +269,94 @@ class LedCtl:
     def __exit__(self, exc_type, exc, tb):
         self.close()
 
-    def _write_frame(self, mode: int, bright_h: int, speed_h: int):
-        frame = build_frame(mode, bright_h, speed_h)
-        for byte in frame:
-            self.ser.write(bytes([byte]))
-            self.ser.flush()
-            time.sleep(self.ib_delay)
+    def _write(self, data) -> None:
+        """os.write() straight to the non-blocking port fd, never waiting.
+
+        Whatever the kernel TX buffer can't take now is queued in _pending and
+        goes out ahead of the next write. The cap is enforced per frame, in
+        set_mode_once(), so a frame is only ever queued whole or not at all.
+        """
+        fd = self._fd
+        if fd is None:
+            self.ser.write(data)
+            return
+        buf = self._pending
+        if buf:
+            buf += data
+        try:
+            n = os.write(fd, buf or data)
+        except BlockingIOError:
+            n = 0
+        if buf:
+            del buf[:n]
+        elif n < len(data):
+            buf += data[n:]
+
+    def _write_selector(self):
+        """Selector for write readiness on _fd, or None if it cannot be polled."""
+        if self._sel is None and self._pollable:
+            # Only a backed-up port gets here, so one-shot sends never load it.
+            import selectors
 
-    def set_mode_once(self, mode: int, brightness: int = 3, speed: int = 3):
+            sel = selectors.DefaultSelector()
+            try:
+                sel.register(self._fd, selectors.EVENT_WRITE)
+            except (OSError, ValueError):
+                sel.close()  # not pollable: wait_until() just sleeps
+                self._pollable = False
+            else:
+                self._sel = sel
+        return self._sel
+
+    def wait_until(self, deadline: float) -> None:
+        """Sleep until `deadline` (time.monotonic()); queued bytes go out meanwhile."""
+        sel = self._write_selector() if self._pending and self._fd is not None else None
+        if sel is not None:
+            while self._pending:
+                left = deadline - time.monotonic()
+                if left <= 0 or not sel.select(left):
+                    return
+                self._write(b"")
+        sleep_until(deadline)
+
+    def set_mode_once(
+        self, mode: int, brightness: int = 3, speed: int = 3, *, force: bool = True
+    ):
+        """Send one frame. force=False skips it if it is the last frame sent.
+
+        The patterns rely on every resend restarting the device effect, so
+        they keep the default; force=False is for callers that only need the
+        device to end up in a state. A frame that doesn't fit in the pending
+        queue is dropped whole and doesn't count as sent.
+        """
+        key = (mode, brightness, speed)
         if self.ser is None:
-            self.open()
-        self._write_frame(mode, brightness, speed)
+            self.open()  # a freshly opened port has no _last_key
+        if key == self._last_key:
+            if not force:
+                return
+            frame = self._last_frame  # pattern loops resend the same frame
+        else:
+            frame = _FRAME_CACHE.get(key) or build_frame(mode, brightness, speed)
+        if len(self._pending) + len(frame) > _PENDING_MAX:
+            return  # device isn't draining: drop the whole frame, not part of it
+        _write_paced(self._write, frame, self.ib_delay, self.baud)
+        self._last_key, self._last_frame = key, frame
+
+
+def drive(ctl: LedCtl, tick: float, mode: int, brightness: int, speed: int) -> None:
+    """Resend one frame every `tick` seconds until Ctrl+C (the pattern loop).
+
+    Missed ticks are dropped rather than sent back to back after a stall.
+    """
+    mono, wait_until, send = time.monotonic, ctl.wait_until, ctl.set_mode_once
+    try:
+        nxt = mono()
+        while True:
+            send(mode, brightness, speed)
+            now = mono()
+            nxt = max(now, nxt + tick)  # drop missed ticks
+            if nxt > now:
+                wait_until(nxt)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,19 @@
+# ledctl/core/timing.py
+from __future__ import annotations
+
+import time
+
+
+def sleep_until(deadline: float, slack: float = 0.0) -> None:
+    """Sleep until time.monotonic() reaches `deadline`.
+
+    time.sleep() may wake up to a scheduler tick late, which LED frames do not
+    notice. Callers that need tighter phase can pass `slack` to sleep short by
+    that much and busy-spin the rest; that costs CPU on every call.
+    """
+    dt = deadline - time.monotonic()
+    if dt > slack:
+        time.sleep(dt - slack)
+    if slack > 0:
+        while time.monotonic() < deadline:
+            pass
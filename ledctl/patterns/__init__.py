@@ -10,19 +10,39 @@ _PATTERNS: Dict[str, str] = {
     "alarm": ".alarm",
 }
 
+# The registry is static, so sort it once instead of on every lookup.
+_NAMES = tuple(sorted(_PATTERNS))
+
 
 def list_patterns() -> Iterable[str]:
-    return sorted(_PATTERNS.keys())
+    return _NAMES
+
+
+# name -> run(), filled by @register as each pattern module is first imported
+_REGISTRY: Dict[str, Callable[..., Any]] = {}
+
+
+def register(name: str):
+    """Decorator for a pattern module's run(): makes it the entry for `name`."""
+
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        _REGISTRY[name] = fn
+        return fn
+
+    return deco
 
 
 def get_pattern(name: str) -> Callable[..., Any]:
+    fn = _REGISTRY.get(name)
+    if fn is not None:
+        return fn
     modname = _PATTERNS.get(name)
     if not modname:
         raise SystemExit(f"Unknown pattern: {name}")
-    mod = import_module(modname, package=__name__)
-    fn = getattr(mod, "run", None)
-    if not callable(fn):
-        raise SystemExit(f"Pattern '{name}' has no callable run()")
+    import_module(modname, package=__name__)  # registers its run()
+    fn = _REGISTRY.get(name)
+    if fn is None:
+        raise SystemExit(f"Pattern '{name}' has no registered run()")
     return fn
 
 
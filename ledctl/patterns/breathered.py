@@ -1,6 +1,6 @@
 # Restart BREATH at preset intervals to keep phase locked on red.
-import time
-from ledctl.core import LedCtl, MODE
+from ledctl.core import LedCtl, MODE, drive
+from ledctl.patterns import register
 
 # Presets you measured:
 # user s -> (device_speed, brightness, period_seconds)
@@ -13,6 +13,7 @@ _PRESETS = {
 }
 
 
+@register("breathered")
 def run(
     *,
     port=None,
@@ -32,16 +33,6 @@ def run(
     tick = float(period) if period is not None else preset_period
 
     with LedCtl(port=port, baud=baud, dtr=dtr, rts=rts) as ctl:
-        try:
-            # initial kick, then re-send every tick to restart at red
-            ctl.set_mode_once(mode, preset_brightness, dev_speed)
-            nxt = time.monotonic() + tick
-            while True:
-                dt = nxt - time.monotonic()
-                if dt > 0:
-                    time.sleep(dt)
-                ctl.set_mode_once(mode, preset_brightness, dev_speed)
-                nxt += tick
-        except KeyboardInterrupt:
-            pass
+        # kick now, then re-send every tick to restart at red
+        drive(ctl, tick, mode, preset_brightness, dev_speed)
     return 0
@@ -1,11 +1,12 @@
 # Force solid red by repeatedly resetting CYCLE at 50 Hz
-import time
-from ledctl.core import LedCtl, MODE
+from ledctl.core import LedCtl, MODE, drive
+from ledctl.patterns import register
 
 _RATE_HZ = 40.0
 _TICK = 1.0 / _RATE_HZ
 
 
+@register("stillred")
 def run(
     *,
     port=None,
@@ -18,14 +19,5 @@ def run(
     mode = mode_num if mode_num is not None else MODE.CYCLE
     # Lower inter-byte delay so we can actually hit 50 Hz
     with LedCtl(port=port, baud=baud, dtr=dtr, rts=rts, ib_delay=0.001) as ctl:
-        try:
-            nxt = time.monotonic()
-            while True:
-                ctl.set_mode_once(mode, brightness, 1)  # speed fixed/ignored
-                nxt += _TICK
-                dt = nxt - time.monotonic()
-                if dt > 0:
-                    time.sleep(dt)
-        except KeyboardInterrupt:
-            pass
+        drive(ctl, _TICK, mode, brightness, 1)  # speed fixed/ignored
     return 0
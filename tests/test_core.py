@@ -0,0 +1,75 @@
+import os
+import time
+import unittest
+from types import SimpleNamespace
+
+from ledctl.core import MODE, LedCtl, build_frame
+from ledctl.core.core import _PENDING_MAX
+
+
+class PendingQueueTest(unittest.TestCase):
+    """LedCtl against a full non-blocking pipe standing in for the TX buffer."""
+
+    def setUp(self):
+        self.r, self.w = os.pipe()
+        os.set_blocking(self.w, False)
+        try:
+            while True:
+                os.write(self.w, b"\0" * 65536)
+        except BlockingIOError:
+            pass
+        self.ctl = LedCtl("/dev/null", ib_delay=0.0001)
+        self.ctl.ser = SimpleNamespace()  # never used: every write has an fd
+        self.ctl._fd = self.w
+
+    def tearDown(self):
+        os.close(self.r)
+        os.close(self.w)
+
+    def drain(self) -> bytes:
+        os.set_blocking(self.r, False)
+        out = b""
+        try:
+            while True:
+                out += os.read(self.r, 65536)
+        except BlockingIOError:
+            return out
+
+    def test_write_queues_what_the_fd_does_not_take(self):
+        self.ctl._write(b"abc")
+        self.assertEqual(self.ctl._pending, b"abc")
+        self.drain()
+        self.ctl._write(b"")
+        self.assertEqual(self.ctl._pending, b"")
+        self.assertEqual(self.drain(), b"abc")
+
+    def test_paced_frame_queued_whole(self):
+        self.ctl.set_mode_once(MODE.RAINBOW, 3, 3)
+        self.assertEqual(self.ctl._pending, build_frame(MODE.RAINBOW, 3, 3))
+        self.assertEqual(self.ctl._last_key, (MODE.RAINBOW, 3, 3))
+
+    def test_paced_frame_dropped_whole_when_queue_is_full(self):
+        filler = b"\0" * (_PENDING_MAX - 2)
+        self.ctl._pending[:] = filler
+        self.ctl.set_mode_once(MODE.RAINBOW, 3, 3)
+        self.assertEqual(self.ctl._pending, filler)
+        self.assertIsNone(self.ctl._last_key)
+
+    def test_dropped_frame_is_not_elided_later(self):
+        self.ctl._pending[:] = b"\0" * _PENDING_MAX
+        self.ctl.set_mode_once(MODE.OFF, 3, 3)
+        self.ctl._pending.clear()
+        self.drain()
+        self.ctl.set_mode_once(MODE.OFF, 3, 3, force=False)
+        self.assertEqual(self.drain(), build_frame(MODE.OFF, 3, 3))
+
+    def test_wait_until_drains_the_queue(self):
+        self.ctl._write(b"abc")
+        self.drain()
+        self.ctl.wait_until(time.monotonic() + 0.05)
+        self.assertEqual(self.ctl._pending, b"")
+        self.assertEqual(self.drain(), b"abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import contextlib
+import io
+import itertools
+import unittest
+
+from ledctl.cli import _fastparse, off, setmode
+from ledctl.cli._common import SERIAL_FLAGS, serial_defaults
+
+_SERIAL_TOKENS = ["-p", "/dev/x", "-T", "--rts", "-B", "9600", "-d", "-0.5"]
+_SERIAL_TOKENS += ["--baud=x", "--", "-x"]
+_SETMODE_TOKENS = ["rainbow", "bogus", "-b", "2", "-s", "-p", "-T"]
+_SETMODE_TOKENS += ["--brightness=7", "--brightness=2", "--speed=9"]
+
+
+def _argparse(parse_args, argv):
+    """argparse's verdict: its namespace as a dict, or None if it rejects argv."""
+    with contextlib.redirect_stderr(io.StringIO()):
+        try:
+            return vars(parse_args(argv))
+        except SystemExit:
+            return None
+
+
+class MatchesArgparseTest(unittest.TestCase):
+    """Whatever the fast parser accepts, argparse accepts with the same result.
+
+    The fast parser may always give up (None) and leave the call to argparse.
+    """
+
+    def check(self, fast, parse_args, tokens, length):
+        accepted = 0
+        for n in range(length + 1):
+            for argv in itertools.product(tokens, repeat=n):
+                argv = list(argv)
+                got = fast(argv)
+                want = _argparse(parse_args, argv)
+                if got is None:
+                    continue
+                accepted += 1
+                self.assertEqual(vars(got), want, argv)
+        self.assertGreater(accepted, 0)
+
+    def test_off(self):
+        self.check(
+            lambda argv: _fastparse.parse(argv, SERIAL_FLAGS, serial_defaults()),
+            off.parse_args,
+            _SERIAL_TOKENS,
+            3,
+        )
+
+    def test_setmode(self):
+        self.check(setmode._fast_parse, setmode.parse_args, _SETMODE_TOKENS, 3)
+
+    def test_repeated_flag_checks_every_value(self):
+        self.assertIsNone(setmode._fast_parse(["rainbow", "-b", "7", "--brightness=2"]))
+        self.assertIsNone(setmode._fast_parse(["rainbow", "-p", "-T"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
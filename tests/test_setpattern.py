@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from ledctl.cli import setpattern
+
+
+class BackgroundFlagTest(unittest.TestCase):
+    """--background and --no-kill-existing survive the two-stage parse."""
+
+    def main(self, *argv):
+        with mock.patch.object(setpattern, "_spawn_background", return_value=0) as spawn, \
+                mock.patch.object(setpattern, "_run_pattern", return_value=0) as run, \
+                mock.patch.object(setpattern, "kill_all_patterns", return_value=0), \
+                mock.patch.object(setpattern, "_hold_run_lock"):
+            self.assertEqual(setpattern.main(list(argv)), 0)
+        return spawn, run
+
+    def test_background_spawns(self):
+        spawn, run = self.main("stillred", "--background", "-b", "2")
+        spawn.assert_called_once_with("stillred", ["-b", "2"], False)
+        run.assert_not_called()
+
+    def test_short_flag_and_no_kill_are_forwarded(self):
+        spawn, _ = self.main("stillred", "-g", "--no-kill-existing")
+        spawn.assert_called_once_with("stillred", [], True)
+
+    def test_foreground_runs(self):
+        spawn, run = self.main("stillred")
+        spawn.assert_not_called()
+        run.assert_called_once()
+
+
+class SpawnFallbackTest(unittest.TestCase):
+    def test_popen_when_posix_spawn_cannot_setsid(self):
+        import subprocess
+
+        with mock.patch("os.posix_spawn", side_effect=NotImplementedError, create=True), \
+                mock.patch.object(subprocess, "Popen") as popen, \
+                mock.patch("builtins.open", mock.mock_open()), \
+                mock.patch("builtins.print"):
+            setpattern._spawn_background("stillred", ["-b", "2"])
+        self.assertTrue(popen.call_args.kwargs["start_new_session"])
+        self.assertEqual(popen.call_args.args[0][-3:], ["stillred", "-b", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()